@@ -44,6 +44,7 @@ class OperationParser:
 
         self._components = self.raw_spec.get("components", {})
         self._schema_cache: dict[str, dict[str, Any]] = {}
+        self._operation_cache: dict[str, OperationDetails] = {}
 
     def get_operations(self) -> list[str]:
         operations: list[str] = []
@@ -57,6 +58,9 @@ class OperationParser:
         return operations
 
     def parse_operation(self, operation_id: str) -> OperationDetails:
+        if operation_id in self._operation_cache:
+            return self._operation_cache[operation_id]
+
         for path, path_item in self._paths.items():
             for method, operation in path_item.items():
                 if method.startswith("x-") or method == "parameters":
@@ -80,7 +84,7 @@ class OperationParser:
 
                 input_model = self._create_input_model(operation_id, parameters, body_schema)
 
-                return OperationDetails(
+                details = OperationDetails(
                     operation_id=operation_id,
                     path=str(path),
                     method=str(method),
@@ -88,6 +92,8 @@ class OperationParser:
                     input_model=input_model,
                     description=description,
                 )
+                self._operation_cache[operation_id] = details
+                return details
 
         raise ValueError(f"Operation {operation_id} not found in spec")
 
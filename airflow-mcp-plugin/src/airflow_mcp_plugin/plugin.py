@@ -13,6 +13,7 @@ from mcp.server.streamable_http import StreamableHTTPServerTransport
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
+from airflow_mcp_plugin.openapi_parser import OperationParser
 from airflow_mcp_plugin.toolset import AirflowOpenAPIToolset
 
 logger = logging.getLogger(__name__)
@@ -40,6 +41,7 @@ class StatelessMCPMount:
     def __init__(self) -> None:
         self._openapi_spec: dict[str, Any] | None = None
         self._spec_lock = asyncio.Lock()
+        self._parser: OperationParser | None = None
         self._toolsets: dict[bool, AirflowOpenAPIToolset] = {}
 
     async def _ensure_openapi_spec(self, base_url: str, token: str) -> dict[str, Any] | None:
@@ -65,7 +67,10 @@ class StatelessMCPMount:
     def _get_toolset(self, spec: dict[str, Any], allow_mutations: bool) -> AirflowOpenAPIToolset:
         key = allow_mutations
         if key not in self._toolsets:
-            self._toolsets[key] = AirflowOpenAPIToolset(spec, allow_mutations)
+            # Safe and unsafe toolsets share one parser so each operation model is built once.
+            if self._parser is None:
+                self._parser = OperationParser(spec)
+            self._toolsets[key] = AirflowOpenAPIToolset(spec, allow_mutations, parser=self._parser)
         return self._toolsets[key]
 
     def _build_server(self, toolset: AirflowOpenAPIToolset, base_url: str, token: str) -> Server:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -18,11 +19,12 @@ class PreparedRequest:
 
 
 class AirflowOpenAPIToolset:
-    def __init__(self, spec: dict[str, Any], allow_mutations: bool) -> None:
-        self._parser = OperationParser(spec)
+    def __init__(self, spec: dict[str, Any], allow_mutations: bool, parser: OperationParser | None = None) -> None:
+        self._parser = parser or OperationParser(spec)
         self._allow_mutations = allow_mutations
         self._tools: dict[str, tuple[types.Tool, OperationDetails]] = {}
         self._build_tools()
+        self._tool_list = tuple(tool for tool, _ in self._tools.values())
 
     def _build_tools(self) -> None:
         for operation_id in self._parser.get_operations():
@@ -41,8 +43,9 @@ class AirflowOpenAPIToolset:
             )
             self._tools[operation_id] = (tool, details)
 
-    def list_tools(self) -> list[types.Tool]:
-        return [tool for tool, _ in self._tools.values()]
+    def list_tools(self) -> Sequence[types.Tool]:
+        # The cached tuple is handed out as-is; being immutable, callers cannot alter it for each other.
+        return self._tool_list
 
     def get_tool(self, name: str) -> tuple[types.Tool, OperationDetails]:
         if name not in self._tools:
@@ -5,6 +5,7 @@ import pytest
 from mcp import types
 from mcp.server.lowlevel import Server
 
+from airflow_mcp_plugin.openapi_parser import OperationParser
 from airflow_mcp_plugin.toolset import AirflowOpenAPIToolset
 
 
@@ -90,6 +91,21 @@ def test_toolset_includes_mutations_when_allowed(sample_spec: dict[str, Any]) ->
     assert tool_names == ["create_item", "get_item"]
 
 
+def test_toolsets_share_parsed_operations(sample_spec: dict[str, Any]) -> None:
+    parser = OperationParser(sample_spec)
+    safe = AirflowOpenAPIToolset(sample_spec, allow_mutations=False, parser=parser)
+    unsafe = AirflowOpenAPIToolset(sample_spec, allow_mutations=True, parser=parser)
+
+    assert safe.get_tool("get_item")[1] is unsafe.get_tool("get_item")[1]
+
+
+def test_list_tools_returns_cached_tuple(sample_spec: dict[str, Any]) -> None:
+    toolset = AirflowOpenAPIToolset(sample_spec, allow_mutations=True)
+    tools = toolset.list_tools()
+    assert isinstance(tools, tuple)
+    assert toolset.list_tools() is tools
+
+
 def test_input_model_accepts_optional_values(sample_spec: dict[str, Any]) -> None:
     toolset = AirflowOpenAPIToolset(sample_spec, allow_mutations=False)
     _, details = toolset.get_tool("get_item")
@@ -19,8 +19,7 @@ It's designed for development and testing purposes in a trusted environment.
 from datetime import timedelta
 
 from airflow.models.param import Param
-from airflow.operators.bash import BashOperator
-from airflow.sdk import dag
+from airflow.sdk import dag, get_parsing_context
 from pendulum import datetime
 
 
@@ -57,6 +56,7 @@ from pendulum import datetime
 )
 def bash_REPL_dag():
     """Bash REPL DAG for executing arbitrary shell commands"""
+    from airflow.operators.bash import BashOperator
 
     BashOperator(
         task_id="execute_bash_command",
@@ -67,4 +67,6 @@ def bash_REPL_dag():
     )
 
 
-bash_REPL_dag()
+# Only build the DAG when the scheduler parses this file or a worker runs one of its tasks.
+if get_parsing_context().dag_id in (None, "bash_REPL_dag"):
+    bash_REPL_dag()
@@ -20,7 +20,7 @@ import signal
 from contextlib import redirect_stderr, redirect_stdout
 
 from airflow.models.param import Param
-from airflow.sdk import dag, task
+from airflow.sdk import dag, get_parsing_context, task
 from pendulum import datetime
 
 
@@ -165,5 +165,6 @@ def python_REPL_dag():
     execute_code()
 
 
-# Instantiate the DAG
-python_REPL_dag()
+# Instantiate the DAG only when the scheduler parses this file or a worker runs one of its tasks
+if get_parsing_context().dag_id in (None, "python_REPL_dag"):
+    python_REPL_dag()
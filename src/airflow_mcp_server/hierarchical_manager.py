@@ -11,6 +11,7 @@ from mcp.server.lowlevel import Server
 
 from airflow_mcp_server.toolset import AirflowOpenAPIToolset
 from airflow_mcp_server.utils.category_mapper import (
+    HTTP_METHODS,
     extract_categories_from_openapi,
     filter_routes_by_methods,
     get_category_info,
@@ -24,7 +25,20 @@ logger = logging.getLogger(__name__)
 class HierarchicalToolManager:
     """Registers hierarchical navigation tools with the MCP server."""
 
-    NAVIGATION_TOOLS = {"browse_categories", "select_category", "get_current_category", "back_to_categories"}
+    __slots__ = (
+        "_server",
+        "_toolset",
+        "_allowed_methods",
+        "_session_state_attr",
+        "_categories",
+        "_category_tool_names",
+        "_default_category",
+        "_navigation_tools",
+        "_list_tools_results",
+        "_category_summaries",
+    )
+
+    NAVIGATION_TOOLS = frozenset({"browse_categories", "select_category", "get_current_category", "back_to_categories"})
 
     def __init__(
         self,
@@ -40,10 +54,14 @@ class HierarchicalToolManager:
 
         all_categories = extract_categories_from_openapi(openapi_spec)
         categories: dict[str, list[dict[str, Any]]] = {}
-        for category, routes in all_categories.items():
-            filtered = filter_routes_by_methods(routes, allowed_methods)
-            if filtered:
-                categories[category] = filtered
+        if allowed_methods.issuperset(HTTP_METHODS):
+            # Unsafe mode allows every method, so there is nothing to filter.
+            categories = all_categories
+        else:
+            for category, routes in all_categories.items():
+                filtered = filter_routes_by_methods(routes, allowed_methods)
+                if filtered:
+                    categories[category] = filtered
 
         self._categories = categories
         self._category_tool_names: dict[str, list[str]] = {
@@ -53,6 +71,8 @@ class HierarchicalToolManager:
         self._default_category = "DAG" if "DAG" in self._categories else None
 
         self._navigation_tools = self._build_navigation_tools()
+        self._list_tools_results: dict[str | None, types.ListToolsResult] = {}
+        self._category_summaries: dict[str | None, str] = {}
         self._register_handlers()
 
         logger.info(
@@ -113,18 +133,7 @@ class HierarchicalToolManager:
         @self._server.list_tools()
         async def _list_tools(_: types.ListToolsRequest | None = None) -> types.ListToolsResult:
             session_state = self._ensure_session_state()
-            selected = session_state["category"]
-
-            tools = list(self._navigation_tools.values())
-            if selected and selected in self._category_tool_names:
-                for name in self._category_tool_names[selected]:
-                    try:
-                        tool, _details = self._toolset.get_tool(name)
-                        tools.append(tool)
-                    except ValueError:
-                        logger.debug("Tool %s not found when listing category %s", name, selected)
-
-            return types.ListToolsResult(tools=tools)
+            return self._list_tools_result(session_state["category"])
 
         @self._server.call_tool()
         async def _call_tool(tool_name: str, arguments: dict[str, Any]):
@@ -137,8 +146,37 @@ class HierarchicalToolManager:
             except ValueError as exc:
                 return [types.TextContent(type="text", text=str(exc))]
 
+    def _list_tools_result(self, selected: str | None) -> types.ListToolsResult:
+        key = selected if selected in self._category_tool_names else None
+        cached = self._list_tools_results.get(key)
+        if cached is not None:
+            return cached
+
+        tools = list(self._navigation_tools.values())
+        if key is not None:
+            for name in self._category_tool_names[key]:
+                try:
+                    tool, _details = self._toolset.get_tool(name)
+                    tools.append(tool)
+                except ValueError:
+                    logger.debug("Tool %s not found when listing category %s", name, key)
+
+        result = types.ListToolsResult(tools=tools)
+        self._list_tools_results[key] = result
+        return result
+
+    def _category_summary(self, category: str | None) -> str:
+        summary = self._category_summaries.get(category)
+        if summary is None:
+            if category is None:
+                summary = get_category_info(self._categories)
+            else:
+                summary = get_category_tools_info(category, self._categories[category])
+            self._category_summaries[category] = summary
+        return summary
+
     async def _handle_browse(self, _: dict[str, Any]) -> list[types.TextContent]:
-        info = get_category_info(self._categories)
+        info = self._category_summary(None)
         return [types.TextContent(type="text", text=info)]
 
     async def _handle_select(self, arguments: dict[str, Any]) -> list[types.TextContent]:
@@ -152,7 +190,7 @@ class HierarchicalToolManager:
         session_state = self._ensure_session_state()
         selected = session_state["category"]
         if selected and selected in self._categories:
-            summary = get_category_tools_info(selected, self._categories[selected])
+            summary = self._category_summary(selected)
             return [types.TextContent(type="text", text=summary)]
         return [types.TextContent(type="text", text="No category selected. Use browse_categories() to explore.")]
 
@@ -181,7 +219,7 @@ class HierarchicalToolManager:
         except Exception as exc:  # pragma: no cover - notification failure path
             logger.debug("Failed to send tool list changed notification: %s", exc)
 
-        summary = get_category_tools_info(category, self._categories[category])
+        summary = self._category_summary(category)
         return summary
 
     async def _reset_category(self) -> str:
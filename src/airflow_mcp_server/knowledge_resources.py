@@ -92,24 +92,34 @@ def _read_file(path: Path) -> str:
         return path.read_text(encoding="utf-8", errors="ignore")
 
 
-def load_knowledge_resources(resources_dir: str | None) -> list[tuple[str, str, Callable[[], str], str]]:
-    """Discover Markdown knowledge resources.
-
-    Returns a list of tuples ``(uri, title, reader, mime_type)``.
-    """
+def resolve_resources_dir(resources_dir: str | None) -> Path | None:
+    """Resolve the resources folder, warning when it is missing or not a directory."""
 
     if not resources_dir:
-        return []
+        return None
 
     root = Path(resources_dir).expanduser()
     try:
         root_resolved = root.resolve(strict=True)
     except FileNotFoundError:
         logger.warning("Resources directory not found: %s", resources_dir)
-        return []
+        return None
 
     if not root_resolved.is_dir():
         logger.warning("Resources directory is not a directory: %s", resources_dir)
+        return None
+
+    return root_resolved
+
+
+def load_knowledge_resources(resources_dir: str | None) -> list[tuple[str, str, Callable[[], str], str]]:
+    """Discover Markdown knowledge resources.
+
+    Returns a list of tuples ``(uri, title, reader, mime_type)``.
+    """
+
+    root_resolved = resolve_resources_dir(resources_dir)
+    if root_resolved is None:
         return []
 
     slugs: set[str] = set()
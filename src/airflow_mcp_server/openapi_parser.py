@@ -6,8 +6,16 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import IO, Any, Literal, cast
 
-import yaml
-from pydantic import BaseModel, Field, create_model
+from pydantic import BaseModel, ConfigDict, Field, create_model
+
+_OPENAPI_TYPE_MAP: dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
 
 
 @dataclass(slots=True)
@@ -27,17 +35,22 @@ class OperationParser:
     """Parse an OpenAPI specification into callable operation details."""
 
     def __init__(self, spec_source: Path | str | dict[str, Any] | bytes | IO[str] | IO[bytes]) -> None:
-        if isinstance(spec_source, bytes):
-            self.raw_spec = yaml.safe_load(spec_source)
-        elif isinstance(spec_source, dict):
+        if isinstance(spec_source, dict):
             self.raw_spec = spec_source
-        elif isinstance(spec_source, (str, Path)):
-            with open(spec_source, encoding="utf-8") as fh:
-                self.raw_spec = yaml.safe_load(fh)
-        elif hasattr(spec_source, "read"):
-            self.raw_spec = yaml.safe_load(cast(IO[Any], spec_source))
-        else:  # pragma: no cover - defensive
-            raise ValueError(f"Unsupported spec source type: {type(spec_source)}")
+        else:
+            # The server hands over an already-decoded spec; YAML is only needed for raw sources.
+            import yaml
+
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            if isinstance(spec_source, bytes):
+                self.raw_spec = yaml.load(spec_source, Loader=loader)
+            elif isinstance(spec_source, (str, Path)):
+                with open(spec_source, "rb") as fh:
+                    self.raw_spec = yaml.load(fh, Loader=loader)
+            elif hasattr(spec_source, "read"):
+                self.raw_spec = yaml.load(cast(IO[Any], spec_source), Loader=loader)
+            else:  # pragma: no cover - defensive
+                raise ValueError(f"Unsupported spec source type: {type(spec_source)}")
 
         if not isinstance(self.raw_spec, dict):
             raise ValueError("OpenAPI spec must be a mapping")
@@ -49,61 +62,57 @@ class OperationParser:
 
         self._components = self.raw_spec.get("components", {})
         self._schema_cache: dict[str, dict[str, Any]] = {}
+        self._operations = self._index_operations()
 
-    def get_operations(self) -> list[str]:
-        operations: list[str] = []
-        for path_item in self._paths.values():
+    def _index_operations(self) -> dict[str, tuple[str, str, dict[str, Any], dict[str, Any]]]:
+        operations: dict[str, tuple[str, str, dict[str, Any], dict[str, Any]]] = {}
+        for path, path_item in self._paths.items():
             for method, operation in path_item.items():
                 if method.startswith("x-") or method == "parameters":
                     continue
                 operation_id = operation.get("operationId")
                 if operation_id:
-                    operations.append(operation_id)
+                    operations.setdefault(operation_id, (path, method, operation, path_item))
         return operations
 
-    def parse_operation(self, operation_id: str) -> OperationDetails:
-        for path, path_item in self._paths.items():
-            for method, operation in path_item.items():
-                if method.startswith("x-") or method == "parameters":
-                    continue
-
-                if operation.get("operationId") != operation_id:
-                    continue
-
-                operation["path"] = path
-                operation["path_item"] = path_item
-                description = operation.get("description") or operation.get("summary") or operation_id
-                parameters = self._extract_parameters(operation)
-
-                body_schema = None
-                if "requestBody" in operation:
-                    content = operation["requestBody"].get("content", {})
-                    if "application/json" in content:
-                        body_schema = content["application/json"].get("schema", {})
-                        if "$ref" in body_schema:
-                            body_schema = self._resolve_ref(body_schema["$ref"])
-
-                input_model = self._create_input_model(operation_id, parameters, body_schema)
-
-                tags = [tag for tag in operation.get("tags", []) if isinstance(tag, str)]
-
-                return OperationDetails(
-                    operation_id=operation_id,
-                    path=str(path),
-                    method=str(method).upper(),
-                    parameters=parameters,
-                    input_model=input_model,
-                    description=description,
-                    tags=tags,
-                )
-
-        raise ValueError(f"Operation {operation_id} not found in spec")
+    def get_operations(self) -> list[str]:
+        return list(self._operations)
 
-    def _extract_parameters(self, operation: dict[str, Any]) -> dict[str, Any]:
+    def parse_operation(self, operation_id: str) -> OperationDetails:
+        try:
+            path, method, operation, path_item = self._operations[operation_id]
+        except KeyError as exc:
+            raise ValueError(f"Operation {operation_id} not found in spec") from exc
+
+        description = operation.get("description") or operation.get("summary") or operation_id
+        parameters = self._extract_parameters(operation, path_item)
+
+        body_schema = None
+        if "requestBody" in operation:
+            content = operation["requestBody"].get("content", {})
+            if "application/json" in content:
+                body_schema = content["application/json"].get("schema", {})
+                if "$ref" in body_schema:
+                    body_schema = self._resolve_ref(body_schema["$ref"])
+
+        input_model = self._create_input_model(operation_id, parameters, body_schema)
+
+        tags = [tag for tag in operation.get("tags", []) if isinstance(tag, str)]
+
+        return OperationDetails(
+            operation_id=operation_id,
+            path=str(path),
+            method=str(method).upper(),
+            parameters=parameters,
+            input_model=input_model,
+            description=description,
+            tags=tags,
+        )
+
+    def _extract_parameters(self, operation: dict[str, Any], path_item: dict[str, Any]) -> dict[str, Any]:
         parameters: dict[str, dict[str, Any]] = {"path": {}, "query": {}, "header": {}}
 
-        path_item = operation.get("path_item", {})
-        if path_item and "parameters" in path_item:
+        if "parameters" in path_item:
             self._process_parameters(path_item["parameters"], parameters)
 
         self._process_parameters(operation.get("parameters", []), parameters)
@@ -160,15 +169,6 @@ class OperationParser:
     ) -> tuple[Any, bool]:
         nullable = bool(schema and schema.get("nullable"))
 
-        mapping: dict[str, Any] = {
-            "string": str,
-            "integer": int,
-            "number": float,
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-        }
-
         if schema and "enum" in schema:
             literal_type = Literal[tuple(schema["enum"])]
             return literal_type, nullable
@@ -176,7 +176,7 @@ class OperationParser:
         if openapi_type == "string" and format_type == "date-time":
             return (str, nullable)
 
-        return (mapping.get(openapi_type, Any), nullable)
+        return (_OPENAPI_TYPE_MAP.get(openapi_type, Any), nullable)
 
     def _merge_allof_schema(self, schema: dict[str, Any]) -> dict[str, Any]:
         if "allOf" not in schema:
@@ -245,6 +245,7 @@ class OperationParser:
                         fields[prop_name] = (annotation, default_value)
                         parameter_mapping["body"].append(prop_name)
 
-        model = create_model(f"{operation_id}_input", **fields)  # type: ignore[arg-type]
+        # Validators and JSON schema are built on first use, so operations that are never listed or called stay cheap.
+        model = create_model(f"{operation_id}_input", __config__=ConfigDict(defer_build=True), **fields)  # type: ignore[arg-type]
         model.model_config["parameter_mapping"] = parameter_mapping
         return model
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from typing import cast
 
@@ -10,29 +11,43 @@ from mcp.server.lowlevel import Server
 from mcp.server.lowlevel.helper_types import ReadResourceContents
 from pydantic import AnyUrl
 
-from airflow_mcp_server.knowledge_resources import load_knowledge_resources
+from airflow_mcp_server.knowledge_resources import load_knowledge_resources, resolve_resources_dir
 
 
 def register_resources(server: Server, resources_dir: str | None) -> None:
-    resources = load_knowledge_resources(resources_dir)
-    resource_map: dict[str, tuple[str, Callable[[], str], str]] = {
-        uri: (title, reader, mime) for uri, title, reader, mime in resources
-    }
+    # Only the cheap existence check runs at startup, so a bad folder is still reported right away.
+    resources_root = resolve_resources_dir(resources_dir)
+    resource_map: dict[str, tuple[str, Callable[[], str], str]] | None = None if resources_root else {}
+    discovery_lock = asyncio.Lock()
+    content_cache: dict[str, str] = {}
+
+    async def _get_resource_map() -> dict[str, tuple[str, Callable[[], str], str]]:
+        # The folder walk is deferred until a client first asks, and runs off the event loop.
+        nonlocal resource_map
+        if resource_map is None:
+            async with discovery_lock:
+                if resource_map is None:
+                    discovered = await asyncio.to_thread(load_knowledge_resources, str(resources_root))
+                    resource_map = {uri: (title, reader, mime) for uri, title, reader, mime in discovered}
+        return resource_map
 
     @server.list_resources()
     async def _list_resources(_: types.ListResourcesRequest | None = None) -> types.ListResourcesResult:
         items = [
             types.Resource(uri=cast(AnyUrl, uri), name=title, mimeType=mime)
-            for uri, (title, _reader, mime) in resource_map.items()
+            for uri, (title, _reader, mime) in (await _get_resource_map()).items()
         ]
         return types.ListResourcesResult(resources=items)
 
     @server.read_resource()
     async def _read_resource(uri: AnyUrl) -> list[ReadResourceContents]:
         uri_str = str(uri)
-        if uri_str not in resource_map:
+        resources = await _get_resource_map()
+        if uri_str not in resources:
             raise ValueError(f"Unknown resource '{uri_str}'")
 
-        _title, reader, mime = resource_map[uri_str]
-        content = reader()
-        return [ReadResourceContents(content=str(content), mime_type=mime)]
+        _title, reader, mime = resources[uri_str]
+        content = content_cache.get(uri_str)
+        if content is None:
+            content = content_cache[uri_str] = str(await asyncio.to_thread(reader))
+        return [ReadResourceContents(content=content, mime_type=mime)]
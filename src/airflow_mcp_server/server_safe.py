@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import logging
+import os
+import re
+import tempfile
 from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import Any, Literal, cast
+from urllib.parse import urlsplit
 
 import aiohttp
+import orjson
 import uvicorn
 from mcp import types
 from mcp.server.lowlevel import Server
@@ -21,6 +28,8 @@ from airflow_mcp_server.hierarchical_manager import HierarchicalToolManager
 from airflow_mcp_server.resources import register_resources
 from airflow_mcp_server.toolset import AirflowOpenAPIToolset
 
+logger = logging.getLogger(__name__)
+
 
 async def serve(
     config: AirflowConfig,
@@ -64,9 +73,7 @@ async def _serve_airflow(
     )
 
     try:
-        async with session.get("/openapi.json") as response:
-            response.raise_for_status()
-            openapi_spec = await response.json()
+        openapi_spec = await _fetch_openapi_spec(session, config.base_url)
 
         allow_mutations = any(method != "GET" for method in allowed_methods)
         toolset = AirflowOpenAPIToolset(openapi_spec, allow_mutations=allow_mutations, session=session)
@@ -107,12 +114,91 @@ async def _serve_airflow(
         await session.close()
 
 
+def _openapi_cache_path(base_url: str) -> Path | None:
+    parts = urlsplit(base_url)
+    name = re.sub(r"[^A-Za-z0-9.-]+", "_", f"{parts.netloc}{parts.path}").strip("_") or "airflow"
+    try:
+        cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    except (RuntimeError, OSError) as exc:
+        # The cache is only an optimization; without a home directory the spec is simply fetched every time.
+        logger.debug("OpenAPI spec cache disabled: %s", exc)
+        return None
+    return cache_root / "airflow-mcp-server" / f"openapi-{name}.json"
+
+
+def _read_cached_etag(cache_path: Path) -> str | None:
+    # The ETag sits on the first line, so revalidation never has to decode the cached spec.
+    try:
+        with cache_path.open("rb") as cache_file:
+            line = cache_file.readline()
+    except FileNotFoundError:
+        return None
+    except OSError as exc:
+        logger.debug("Ignoring unreadable OpenAPI cache %s: %s", cache_path, exc)
+        return None
+    if not line.endswith(b"\n") or not line.strip():
+        logger.debug("Ignoring OpenAPI cache %s without an ETag line", cache_path)
+        return None
+    return line.strip().decode("latin-1")
+
+
+def _read_cached_spec(cache_path: Path) -> dict[str, Any] | None:
+    try:
+        _etag, _, body = cache_path.read_bytes().partition(b"\n")
+        return orjson.loads(body)
+    except Exception as exc:
+        logger.debug("Ignoring unreadable OpenAPI cache %s: %s", cache_path, exc)
+        return None
+
+
+def _write_cached_spec(cache_path: Path, etag: str, body: bytes) -> None:
+    # Write to a sibling temp file and swap it in, so a crash or a concurrent writer never leaves a truncated cache.
+    tmp_path: str | None = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=f".{cache_path.name}.", suffix=".tmp")
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(etag.encode("latin-1") + b"\n")
+            tmp_file.write(body)
+        os.replace(tmp_path, cache_path)
+    except (OSError, UnicodeEncodeError) as exc:
+        logger.debug("Failed to write OpenAPI cache %s: %s", cache_path, exc)
+        if tmp_path is not None:
+            Path(tmp_path).unlink(missing_ok=True)
+
+
+async def _fetch_openapi_spec(session: aiohttp.ClientSession, base_url: str) -> dict[str, Any]:
+    """Fetch the OpenAPI spec, revalidating a cached copy when Airflow sends an ETag."""
+
+    cache_path = _openapi_cache_path(base_url)
+    cached_etag = _read_cached_etag(cache_path) if cache_path else None
+    headers = {"If-None-Match": cached_etag} if cached_etag else None
+
+    async with session.get("/openapi.json", headers=headers) as response:
+        if response.status == 304:
+            # raise_for_status() lets 304 through, so a missing or unreadable cache must fail here.
+            cached_spec = _read_cached_spec(cache_path) if cached_etag and cache_path else None
+            if cached_spec is None:
+                raise ValueError(f"Airflow answered 304 Not Modified for /openapi.json but no usable cached copy is available at {cache_path}")
+            logger.info("OpenAPI spec not modified; using cached copy from %s", cache_path)
+            return cached_spec
+        response.raise_for_status()
+        body = await response.read()
+        openapi_spec = orjson.loads(body)
+        etag = response.headers.get("ETag")
+
+    if etag and cache_path:
+        _write_cached_spec(cache_path, etag, body)
+    return openapi_spec
+
+
 def _register_static_tools(server: Server, toolset: AirflowOpenAPIToolset) -> None:
-    tools = toolset.list_tools()
+    # The static tool set never changes, so the result is built once and shared by every tools/list call.
+    list_result = types.ListToolsResult(tools=toolset.list_tools())
 
     @server.list_tools()
     async def _list_tools(_: types.ListToolsRequest | None = None) -> types.ListToolsResult:
-        return types.ListToolsResult(tools=tools)
+        return list_result
 
     @server.call_tool()
     async def _call_tool(tool_name: str, arguments: dict[str, object]):
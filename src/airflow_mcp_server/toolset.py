@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from typing import Any
 
 import aiohttp
+import orjson
 from mcp import types
 
 from airflow_mcp_server.openapi_parser import OperationDetails, OperationParser
@@ -22,6 +22,8 @@ class PreparedRequest:
 class AirflowOpenAPIToolset:
     """Generate MCP tool definitions from the Airflow OpenAPI specification."""
 
+    __slots__ = ("_parser", "_allow_mutations", "_session", "_tools", "_category_index")
+
     def __init__(self, spec: dict[str, Any], allow_mutations: bool, session: aiohttp.ClientSession) -> None:
         self._parser = OperationParser(spec)
         self._allow_mutations = allow_mutations
@@ -33,7 +35,7 @@ class AirflowOpenAPIToolset:
     def _build_tools(self) -> None:
         for operation_id in self._parser.get_operations():
             details = self._parser.parse_operation(operation_id)
-            method = details.method.upper()
+            method = details.method
             if not self._allow_mutations and method != "GET":
                 continue
 
@@ -150,8 +152,8 @@ class AirflowOpenAPIToolset:
                 if not body:
                     return ([], {})
                 try:
-                    parsed = json.loads(body.decode("utf-8"))
-                except json.JSONDecodeError:
+                    parsed = orjson.loads(body)
+                except orjson.JSONDecodeError:
                     text = body.decode("utf-8", errors="replace")
                     return [types.TextContent(type="text", text=text)]
                 return ([], parsed)
@@ -1,5 +1,9 @@
 """Category mapping utilities for Airflow OpenAPI endpoints."""
 
+HTTP_METHODS = ("GET", "POST", "PUT", "DELETE", "PATCH")
+
+_PATH_TO_TOOL_NAME = str.maketrans({"/": "_", "{": None, "}": None})
+
 
 def extract_categories_from_openapi(openapi_spec: dict) -> dict[str, list[dict]]:
     """Extract categories and their routes from OpenAPI spec.
@@ -17,22 +21,23 @@ def extract_categories_from_openapi(openapi_spec: dict) -> dict[str, list[dict]]
 
     for path, methods in openapi_spec["paths"].items():
         for method, operation in methods.items():
-            if method.upper() in ["GET", "POST", "PUT", "DELETE", "PATCH"]:
-                tags = operation.get("tags", ["Uncategorized"])
-
-                route_info = {
-                    "path": path,
-                    "method": method.upper(),
-                    "operation_id": operation.get("operationId", ""),
-                    "summary": operation.get("summary", ""),
-                    "description": operation.get("description", ""),
-                    "tags": tags,
-                }
-
-                for tag in tags:
-                    if tag not in categories:
-                        categories[tag] = []
-                    categories[tag].append(route_info)
+            method_upper = method.upper()
+            if method_upper not in HTTP_METHODS:
+                continue
+
+            tags = operation.get("tags", ["Uncategorized"])
+
+            route_info = {
+                "path": path,
+                "method": method_upper,
+                "operation_id": operation.get("operationId", ""),
+                "summary": operation.get("summary", ""),
+                "description": operation.get("description", ""),
+                "tags": tags,
+            }
+
+            for tag in tags:
+                categories.setdefault(tag, []).append(route_info)
 
     return categories
 
@@ -75,14 +80,11 @@ def get_category_tools_info(category: str, routes: list[dict]) -> str:
     """
     lines = [f"{category} Tools ({len(routes)} available):\n"]
 
-    methods_groups = {}
+    methods_groups: dict[str, list[dict]] = {}
     for route in routes:
-        method = route["method"]
-        if method not in methods_groups:
-            methods_groups[method] = []
-        methods_groups[method].append(route)
+        methods_groups.setdefault(route["method"], []).append(route)
 
-    for method in ["GET", "POST", "PUT", "DELETE", "PATCH"]:
+    for method in HTTP_METHODS:
         if method in methods_groups:
             lines.append(f"\n{method} Operations:")
 
@@ -124,6 +126,4 @@ def get_tool_name_from_route(route: dict) -> str:
     if operation_id:
         return operation_id
 
-    path = route["path"].replace("/", "_").replace("{", "").replace("}", "")
-    method = route["method"].lower()
-    return f"{method}{path}"
+    return f"{route['method'].lower()}{route['path'].translate(_PATH_TO_TOOL_NAME)}"
@@ -3,9 +3,12 @@
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_openapi_spec():
-    """Sample OpenAPI spec for testing across multiple test files."""
+    """Sample OpenAPI spec for testing across multiple test files.
+
+    Session-scoped and shared, so tests must treat it as read-only.
+    """
     return {
         "openapi": "3.0.0",
         "info": {"title": "Airflow API", "version": "1.0.0"},
@@ -14,7 +17,7 @@ def sample_openapi_spec():
                 "get": {
                     "operationId": "get_dags",
                     "summary": "Get all DAGs",
-                    "tags": ["DAGs"],
+                    "tags": ["DAG"],
                     "responses": {
                         "200": {
                             "description": "List of DAGs",
@@ -24,8 +27,16 @@ def sample_openapi_spec():
                         }
                     },
                 },
-                "post": {"operationId": "create_dag", "summary": "Create a DAG", "tags": ["DAGs"], "responses": {"201": {"description": "Created"}}},
+                "post": {"operationId": "create_dag", "summary": "Create a DAG", "tags": ["DAG"], "responses": {"201": {"description": "Created"}}},
             },
             "/api/v1/connections": {"get": {"operationId": "get_connections", "summary": "Get connections", "tags": ["Connections"], "responses": {"200": {"description": "Success"}}}},
+            "/api/v1/health": {
+                "get": {
+                    "operationId": "health_check",
+                    "summary": "Health check",
+                    # No tags - should go to "Uncategorized"
+                    "responses": {"200": {"description": "Success"}},
+                }
+            },
         },
     }
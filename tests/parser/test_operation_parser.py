@@ -0,0 +1,152 @@
+"""Tests for OperationParser against the bundled Airflow 3 OpenAPI spec."""
+
+import functools
+from pathlib import Path
+from typing import Literal, get_args, get_origin
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from airflow_mcp_server.openapi_parser import OperationParser
+
+SPEC_PATH = Path(__file__).parent / "openapi.json"
+
+# Under `pytest -n auto --dist loadgroup` keep these on one worker so the session parser is built once.
+pytestmark = pytest.mark.xdist_group("parser")
+
+
+@pytest.fixture(scope="session")
+def _raw_spec_dict():
+    """Load and decode the Airflow OpenAPI spec once per test session."""
+    return orjson.loads(SPEC_PATH.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def parser(_raw_spec_dict):
+    """Share one parser across the session; it never writes to the spec it is given."""
+    return OperationParser(_raw_spec_dict)
+
+
+@pytest.fixture(scope="session")
+def parsed_ops(parser):
+    """Memoise parse_operation so each operation's input model is built once per session."""
+    return functools.lru_cache(maxsize=None)(parser.parse_operation)
+
+
+def test_get_operations(parser):
+    """Every operationId in the spec should be listed once."""
+    operations = parser.get_operations()
+
+    assert "get_dags" in operations
+    assert "post_connection" in operations
+    assert len(operations) == len(set(operations))
+
+
+@pytest.mark.parametrize(
+    ("operation_id", "method", "path", "mapping"),
+    [
+        ("get_dags", "GET", "/api/v2/dags", "query"),
+        ("get_dag", "GET", "/api/v2/dags/{dag_id}", "path"),
+        ("patch_dag", "PATCH", "/api/v2/dags/{dag_id}", "body"),
+        ("post_connection", "POST", "/api/v2/connections", "body"),
+    ],
+)
+def test_parse_operation_basic(parsed_ops, operation_id, method, path, mapping):
+    """Test basic operation details across the parameter locations."""
+    details = parsed_ops(operation_id)
+
+    assert details.operation_id == operation_id
+    assert details.path == path
+    assert details.method == method
+    assert details.description
+    assert details.input_model.model_config["parameter_mapping"][mapping]
+
+
+def test_parse_get_dags(parsed_ops):
+    """Tags and query parameters of get_dags should keep their mapped type and default."""
+    details = parsed_ops("get_dags")
+
+    assert details.tags == ["DAG"]
+    assert "limit" in details.input_model.model_config["parameter_mapping"]["query"]
+    assert details.parameters["query"]["limit"]["type"] is int
+    assert details.parameters["query"]["limit"]["default"] == 50
+    assert not details.input_model.model_fields["limit"].is_required()
+
+
+def test_parse_operation_with_path_params(parsed_ops):
+    """Path parameters should be required fields on the input model."""
+    details = parsed_ops("get_dag")
+
+    assert details.input_model.model_config["parameter_mapping"]["path"] == ["dag_id"]
+    assert details.input_model.__annotations__["dag_id"] is str
+    assert details.input_model.model_fields["dag_id"].is_required()
+
+
+def test_parse_operation_with_body(parsed_ops):
+    """Request body properties should be mapped alongside path and query parameters."""
+    details = parsed_ops("patch_dag")
+    mapping = details.input_model.model_config["parameter_mapping"]
+
+    assert details.method == "PATCH"
+    assert mapping["path"] == ["dag_id"]
+    assert mapping["query"] == ["update_mask"]
+    assert mapping["body"] == ["is_paused"]
+
+
+def test_connection_schema_field_alias(parsed_ops):
+    """The connection 'schema' property should not shadow BaseModel.schema."""
+    details = parsed_ops("post_connection")
+
+    assert "connection_schema" in details.input_model.model_config["parameter_mapping"]["body"]
+    assert details.input_model.model_fields["connection_schema"].alias == "schema"
+
+
+def test_deferred_input_model_builds_on_first_use(_raw_spec_dict):
+    """A deferred model should validate, render its schema and keep parameter_mapping once built."""
+    model = OperationParser(_raw_spec_dict).parse_operation("get_dag_runs").input_model
+    assert model.__pydantic_complete__ is False
+
+    with pytest.raises(ValidationError):
+        model(limit=5)
+    instance = model(dag_id="example", limit=5)
+    schema = model.model_json_schema()
+
+    assert model.__pydantic_complete__ is True
+    assert instance.model_dump(exclude_none=True)["limit"] == 5
+    assert schema["required"] == ["dag_id"]
+    assert "limit" in schema["properties"]
+    assert model.model_config["parameter_mapping"]["path"] == ["dag_id"]
+    assert "limit" in model.model_config["parameter_mapping"]["query"]
+
+
+def test_map_parameter_schema_array(parser):
+    """Array query parameters should map to list."""
+    result = parser._map_parameter_schema({"name": "order_by", "in": "query", "schema": {"type": "array", "items": {"type": "string"}}})
+
+    assert result["type"] is list
+    assert result["required"] is False
+
+
+def test_map_type_enum(parser):
+    """Enum schemas should map to a Literal of the allowed values."""
+    field_type, nullable = parser._map_type("string", None, {"enum": ["queued", "running"], "nullable": True})
+
+    assert get_origin(field_type) is Literal
+    assert get_args(field_type) == ("queued", "running")
+    assert nullable is True
+
+
+def test_parse_operation_leaves_spec_untouched(parser, _raw_spec_dict):
+    """Parsing should not annotate the shared spec in place."""
+    parser.parse_operation("get_dag")
+
+    operation = _raw_spec_dict["paths"]["/api/v2/dags/{dag_id}"]["get"]
+    assert "path" not in operation
+    assert "path_item" not in operation
+
+
+def test_parse_unknown_operation(parser):
+    """Unknown operation ids should raise ValueError."""
+    with pytest.raises(ValueError, match="Operation missing_operation not found in spec"):
+        parser.parse_operation("missing_operation")
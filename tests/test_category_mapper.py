@@ -1,40 +1,18 @@
 """Tests for category mapper utilities."""
 
-import pytest
-
 from airflow_mcp_server.utils.category_mapper import extract_categories_from_openapi, filter_routes_by_methods, get_category_info, get_category_tools_info, get_tool_name_from_route
 
 
-@pytest.fixture
-def sample_openapi_spec():
-    """Sample OpenAPI spec for testing."""
-    return {
-        "openapi": "3.0.0",
-        "info": {"title": "Test API", "version": "1.0.0"},
-        "paths": {
-            "/api/v1/dags": {"get": {"operationId": "get_dags", "summary": "Get all DAGs", "tags": ["DAGs"]}, "post": {"operationId": "create_dag", "summary": "Create a DAG", "tags": ["DAGs"]}},
-            "/api/v1/connections": {"get": {"operationId": "get_connections", "summary": "Get connections", "tags": ["Connections"]}},
-            "/api/v1/health": {
-                "get": {
-                    "operationId": "health_check",
-                    "summary": "Health check",
-                    # No tags - should go to "Uncategorized"
-                }
-            },
-        },
-    }
-
-
 def test_extract_categories_from_openapi(sample_openapi_spec):
     """Test extracting categories from OpenAPI spec."""
     categories = extract_categories_from_openapi(sample_openapi_spec)
 
-    assert "DAGs" in categories
+    assert "DAG" in categories
     assert "Connections" in categories
     assert "Uncategorized" in categories
 
-    # Check DAGs category has 2 operations
-    assert len(categories["DAGs"]) == 2
+    # Check DAG category has 2 operations
+    assert len(categories["DAG"]) == 2
     assert len(categories["Connections"]) == 1
     assert len(categories["Uncategorized"]) == 1
 
@@ -4,6 +4,9 @@ import pytest
 
 from airflow_mcp_server.config import AirflowConfig
 
+MISSING_BASE_URL = "Missing required configuration: base_url"
+MISSING_AUTH_TOKEN = "Missing required configuration: auth_token"
+
 
 def test_config_valid():
     """Test valid configuration."""
@@ -13,31 +16,19 @@ def test_config_valid():
     assert config.auth_token == "test-token"
 
 
-def test_config_missing_base_url():
-    """Test configuration with missing base_url."""
-    with pytest.raises(ValueError, match="Missing required configuration: base_url"):
-        AirflowConfig(base_url=None, auth_token="test-token")
-
-
-def test_config_empty_base_url():
-    """Test configuration with empty base_url."""
-    with pytest.raises(ValueError, match="Missing required configuration: base_url"):
-        AirflowConfig(base_url="", auth_token="test-token")
-
-
-def test_config_missing_auth_token():
-    """Test configuration with missing auth_token."""
-    with pytest.raises(ValueError, match="Missing required configuration: auth_token"):
-        AirflowConfig(base_url="http://localhost:8080", auth_token=None)
-
-
-def test_config_empty_auth_token():
-    """Test configuration with empty auth_token."""
-    with pytest.raises(ValueError, match="Missing required configuration: auth_token"):
-        AirflowConfig(base_url="http://localhost:8080", auth_token="")
-
-
-def test_config_both_missing():
-    """Test configuration with both values missing."""
-    with pytest.raises(ValueError, match="Missing required configuration: base_url"):
-        AirflowConfig(base_url=None, auth_token=None)
+@pytest.mark.parametrize(
+    ("base_url", "auth_token", "error"),
+    [
+        pytest.param(None, "test-token", MISSING_BASE_URL, id="missing-base-url"),
+        pytest.param("", "test-token", MISSING_BASE_URL, id="empty-base-url"),
+        pytest.param("http://localhost:8080", None, MISSING_AUTH_TOKEN, id="missing-auth-token"),
+        pytest.param("http://localhost:8080", "", MISSING_AUTH_TOKEN, id="empty-auth-token"),
+        pytest.param(None, None, MISSING_BASE_URL, id="both-missing"),
+    ],
+)
+def test_config_invalid(base_url, auth_token, error):
+    """Test configuration with a missing or empty required value."""
+    with pytest.raises(ValueError) as exc_info:
+        AirflowConfig(base_url=base_url, auth_token=auth_token)
+
+    assert str(exc_info.value).startswith(error)
@@ -1,44 +1,15 @@
 """Tests for HierarchicalToolManager."""
 
 from types import SimpleNamespace
-from typing import cast
+from typing import Any
 
 import pytest
 from mcp import types
-from mcp.server.lowlevel import Server
 
 from airflow_mcp_server.hierarchical_manager import HierarchicalToolManager
-from airflow_mcp_server.toolset import AirflowOpenAPIToolset
 
 
-@pytest.fixture
-def sample_openapi_spec():
-    """Sample OpenAPI spec for testing."""
-    return {
-        "openapi": "3.0.0",
-        "info": {"title": "Airflow API", "version": "1.0.0"},
-        "paths": {
-            "/api/v1/dags": {
-                "get": {
-                    "operationId": "get_dags",
-                    "summary": "Get all DAGs",
-                    "tags": ["DAG"],
-                    "responses": {"200": {"description": "Success"}},
-                }
-            },
-            "/api/v1/connections": {
-                "get": {
-                    "operationId": "get_connections",
-                    "summary": "Get connections",
-                    "tags": ["Connections"],
-                    "responses": {"200": {"description": "Success"}},
-                }
-            },
-        },
-    }
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def spec_without_dag():
     return {
         "openapi": "3.0.0",
@@ -56,8 +27,25 @@ def spec_without_dag():
     }
 
 
+def _tool_names(result: types.ListToolsResult) -> frozenset[str]:
+    return frozenset(tool.name for tool in result.tools)
+
+
+GET_DAGS_TOOL = types.Tool(
+    name="get_dags",
+    description="Fetch DAGs",
+    inputSchema={"type": "object"},
+    outputSchema=None,
+)
+
+
 class FakeSession:
+    __slots__ = ("notifications", "_airflow_category_state")
+
     def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
         self.notifications = 0
         self._airflow_category_state = None
 
@@ -66,21 +54,25 @@ class FakeSession:
 
 
 class FakeServer:
+    __slots__ = ("list_handler", "call_handler", "_request_context")
+
     def __init__(self) -> None:
-        self.list_handlers = []
-        self.call_handlers = []
+        self.list_handler: Any = None
+        self.call_handler: Any = None
         self._request_context = SimpleNamespace(session=FakeSession())
 
     def list_tools(self):
         def decorator(func):
-            self.list_handlers.append(func)
+            assert self.list_handler is None, "list_tools handler registered twice"
+            self.list_handler = func
             return func
 
         return decorator
 
     def call_tool(self):
         def decorator(func):
-            self.call_handlers.append(func)
+            assert self.call_handler is None, "call_tool handler registered twice"
+            self.call_handler = func
             return func
 
         return decorator
@@ -89,15 +81,18 @@ class FakeServer:
     def request_context(self):
         return self._request_context
 
+    def reset(self) -> None:
+        self._request_context.session.reset()
+
 
 class FakeToolset:
+    __slots__ = ("tool", "last_call")
+
     def __init__(self) -> None:
-        self.tool = types.Tool(
-            name="get_dags",
-            description="Fetch DAGs",
-            inputSchema={"type": "object"},
-            outputSchema=None,
-        )
+        self.tool = GET_DAGS_TOOL
+        self.reset()
+
+    def reset(self) -> None:
         self.last_call: tuple[str, dict[str, str]] | None = None
 
     def list_tools(self):
@@ -111,65 +106,91 @@ class FakeToolset:
         return [types.TextContent(type="text", text="ok")]
 
 
-@pytest.mark.asyncio
-async def test_hierarchical_manager_navigation(sample_openapi_spec):
+@pytest.fixture
+def server():
+    return FakeServer()
+
+
+@pytest.fixture
+def toolset():
+    return FakeToolset()
+
+
+@pytest.fixture(scope="module")
+def _wired_manager(sample_openapi_spec):
     server = FakeServer()
     toolset = FakeToolset()
+    HierarchicalToolManager(server, toolset, sample_openapi_spec, {"GET"})  # type: ignore[arg-type]
+    return server, toolset
+
+
+@pytest.fixture
+def wired_manager(_wired_manager):
+    """Hand out the module's wired manager with the per-test fake state cleared."""
+    server, toolset = _wired_manager
+    server.reset()
+    toolset.reset()
+    return server, toolset
 
-    HierarchicalToolManager(cast(Server, server), cast(AirflowOpenAPIToolset, toolset), sample_openapi_spec, {"GET"})
 
-    assert len(server.list_handlers) == 1
-    assert len(server.call_handlers) == 1
+async def test_hierarchical_manager_navigation(wired_manager):
+    server, toolset = wired_manager
 
-    list_handler = server.list_handlers[0]
-    call_handler = server.call_handlers[0]
+    assert server.list_handler is not None
+    assert server.call_handler is not None
+
+    list_handler = server.list_handler
+    call_handler = server.call_handler
 
     result = await list_handler(None)
-    nav_names = {tool.name for tool in result.tools}
-    assert {"browse_categories", "select_category", "get_current_category", "back_to_categories"}.issubset(nav_names)
+    assert _tool_names(result) >= {"browse_categories", "select_category", "get_current_category", "back_to_categories"}
 
     await call_handler("select_category", {"category": "DAG"})
     assert server.request_context.session.notifications == 1
 
     result_after = await list_handler(None)
-    tool_names = {tool.name for tool in result_after.tools}
-    assert "get_dags" in tool_names
+    assert "get_dags" in _tool_names(result_after)
 
     await call_handler("get_dags", {"foo": "bar"})
     assert toolset.last_call == ("get_dags", {"foo": "bar"})
 
 
-@pytest.mark.asyncio
-async def test_default_category_selected_on_first_list(sample_openapi_spec):
-    server = FakeServer()
-    toolset = FakeToolset()
-
-    HierarchicalToolManager(cast(Server, server), cast(AirflowOpenAPIToolset, toolset), sample_openapi_spec, {"GET"})
+async def test_default_category_selected_on_first_list(wired_manager):
+    server, _ = wired_manager
 
-    list_handler = server.list_handlers[0]
+    list_handler = server.list_handler
     result = await list_handler(None)
 
-    tool_names = {tool.name for tool in result.tools}
-    assert "get_dags" in tool_names
+    assert "get_dags" in _tool_names(result)
 
     state = server.request_context.session._airflow_category_state
     assert state is not None
     assert state["category"] == "DAG"
 
 
-@pytest.mark.asyncio
-async def test_default_category_not_set_when_missing(spec_without_dag):
-    server = FakeServer()
-    toolset = FakeToolset()
-
-    HierarchicalToolManager(cast(Server, server), cast(AirflowOpenAPIToolset, toolset), spec_without_dag, {"GET"})
+async def test_default_category_not_set_when_missing(server, toolset, spec_without_dag):
+    HierarchicalToolManager(server, toolset, spec_without_dag, {"GET"})  # type: ignore[arg-type]
 
-    list_handler = server.list_handlers[0]
+    list_handler = server.list_handler
     result = await list_handler(None)
 
-    tool_names = {tool.name for tool in result.tools}
-    assert "get_dags" not in tool_names
+    assert "get_dags" not in _tool_names(result)
 
     state = server.request_context.session._airflow_category_state
     assert state is not None
     assert state["category"] is None
+
+
+async def test_list_tools_result_reused_per_category(wired_manager):
+    server, _ = wired_manager
+
+    list_handler = server.list_handler
+    call_handler = server.call_handler
+
+    first = await list_handler(None)
+    assert await list_handler(None) is first
+
+    await call_handler("back_to_categories", {})
+    browsing = await list_handler(None)
+    assert browsing is not first
+    assert "get_dags" not in _tool_names(browsing)
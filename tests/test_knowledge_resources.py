@@ -1,6 +1,6 @@
 """Tests for resources directory registration helpers."""
 
-from pathlib import Path
+import pytest
 
 from airflow_mcp_server.knowledge_resources import load_knowledge_resources
 
@@ -9,30 +9,29 @@ def _materialize(resources):
     return {uri: reader() for uri, _title, reader, _mime in resources}
 
 
-def test_registers_markdown_files(tmp_path: Path):
-    """Markdown files should be discovered with stable URIs."""
-    doc = tmp_path / "Guide.md"
-    doc.write_text("# Title\nBody", encoding="utf-8")
-
-    resources = load_knowledge_resources(str(tmp_path))
-    contents = _materialize(resources)
+@pytest.fixture(scope="module")
+def knowledge_contents(tmp_path_factory):
+    """Load one shared resources folder and read every discovered file once."""
+    resources_dir = tmp_path_factory.mktemp("resources")
+    (resources_dir / "Guide.md").write_text("# Title\nBody", encoding="utf-8")
+    (resources_dir / "note.md").write_text("first", encoding="utf-8")
+    (resources_dir / "note.markdown").write_text("second", encoding="utf-8")
 
-    assert "file:///guide" in contents
-    assert contents["file:///guide"] == "# Title\nBody"
+    return _materialize(load_knowledge_resources(str(resources_dir)))
 
 
-def test_duplicate_names_get_unique_slugs(tmp_path: Path):
-    """Files with matching stems should receive unique identifiers."""
-    (tmp_path / "note.md").write_text("first", encoding="utf-8")
-    (tmp_path / "note.markdown").write_text("second", encoding="utf-8")
+def test_registers_markdown_files(knowledge_contents):
+    """Markdown files should be discovered with stable URIs."""
+    assert "file:///guide" in knowledge_contents
+    assert knowledge_contents["file:///guide"] == "# Title\nBody"
 
-    resources = load_knowledge_resources(str(tmp_path))
-    contents = _materialize(resources)
 
-    assert "file:///note" in contents
-    assert "file:///note-2" in contents
-    assert contents["file:///note"] == "first"
-    assert contents["file:///note-2"] == "second"
+def test_duplicate_names_get_unique_slugs(knowledge_contents):
+    """Files with matching stems should receive unique identifiers."""
+    assert "file:///note" in knowledge_contents
+    assert "file:///note-2" in knowledge_contents
+    assert knowledge_contents["file:///note"] == "first"
+    assert knowledge_contents["file:///note-2"] == "second"
 
 
 def test_missing_directory_logs_warning(caplog):
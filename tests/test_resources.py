@@ -0,0 +1,71 @@
+"""Tests for MCP resource registration."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from pydantic import AnyUrl
+
+from airflow_mcp_server.knowledge_resources import load_knowledge_resources
+from airflow_mcp_server.resources import register_resources
+
+
+class FakeServer:
+    def __init__(self) -> None:
+        self.list_handler = None
+        self.read_handler = None
+
+    def list_resources(self):
+        def decorator(func):
+            self.list_handler = func
+            return func
+
+        return decorator
+
+    def read_resource(self):
+        def decorator(func):
+            self.read_handler = func
+            return func
+
+        return decorator
+
+
+async def test_resources_loaded_on_first_request(tmp_path: Path):
+    (tmp_path / "guide.md").write_text("# Guide\nBody", encoding="utf-8")
+    server = FakeServer()
+
+    with patch("airflow_mcp_server.resources.load_knowledge_resources", wraps=load_knowledge_resources) as loader:
+        register_resources(server, str(tmp_path))  # type: ignore[arg-type]
+        loader.assert_not_called()
+
+        result = await server.list_handler(None)
+        assert [resource.name for resource in result.resources] == ["Guide"]
+
+        contents = await server.read_handler(AnyUrl("file:///guide"))
+        assert contents[0].content == "# Guide\nBody"
+        loader.assert_called_once()
+
+
+async def test_resource_content_cached_after_first_read(tmp_path: Path):
+    doc = tmp_path / "guide.md"
+    doc.write_text("first", encoding="utf-8")
+    server = FakeServer()
+    register_resources(server, str(tmp_path))  # type: ignore[arg-type]
+
+    first = await server.read_handler(AnyUrl("file:///guide"))
+    doc.write_text("second", encoding="utf-8")
+    second = await server.read_handler(AnyUrl("file:///guide"))
+
+    assert first[0].content == second[0].content == "first"
+
+
+async def test_missing_directory_warns_at_registration(tmp_path: Path, caplog):
+    server = FakeServer()
+
+    with caplog.at_level("WARNING"), patch("airflow_mcp_server.resources.load_knowledge_resources") as loader:
+        register_resources(server, str(tmp_path / "missing"))  # type: ignore[arg-type]
+        assert "Resources directory not found" in caplog.text
+
+        result = await server.list_handler(None)
+
+    loader.assert_not_called()
+    assert result.resources == []
@@ -1,58 +1,94 @@
 """Tests for server modules."""
 
+import asyncio
+from contextlib import ExitStack
 from typing import Any
-from unittest.mock import ANY, AsyncMock, Mock, patch
+from unittest.mock import ANY, DEFAULT, patch
 
+import orjson
 import pytest
 
 from airflow_mcp_server import server_safe, server_unsafe
 from airflow_mcp_server.config import AirflowConfig
 
+SAFE_METHODS = frozenset({"GET"})
+UNSAFE_METHODS = frozenset({"GET", "POST", "PUT", "DELETE", "PATCH"})
 
-@pytest.fixture
-def mock_config():
-    """Create mock configuration."""
-    return AirflowConfig(base_url="http://localhost:8080", auth_token="test-token")
 
+def _unvalidated_config(base_url: str | None, auth_token: str | None) -> AirflowConfig:
+    """Build an AirflowConfig that skips __init__ validation, as a misconfigured caller could."""
+    config = AirflowConfig.__new__(AirflowConfig)
+    config.base_url = base_url
+    config.auth_token = auth_token
+    return config
 
-@pytest.fixture
-def mock_openapi_response():
-    """Mock OpenAPI response."""
-    return {"openapi": "3.0.0", "info": {"title": "Airflow API", "version": "1.0.0"}, "paths": {"/api/v1/dags": {"get": {"operationId": "get_dags", "summary": "Get all DAGs", "tags": ["DAGs"]}}}}
 
+CONFIG_NO_URL = _unvalidated_config(None, "token")
+CONFIG_NO_TOKEN = _unvalidated_config("http://localhost", None)
 
-@pytest.mark.asyncio
-async def test_safe_server_delegates_to_runtime(mock_config):
-    runtime_mock = AsyncMock()
-    with patch("airflow_mcp_server.server_safe._serve_airflow", runtime_mock):
-        await server_safe.serve(mock_config, static_tools=True, transport="stdio", resources_dir="/tmp/resources")
+OPENAPI_SPEC = {"openapi": "3.0.0", "info": {"title": "Airflow API", "version": "1.0.0"}, "paths": {"/api/v1/dags": {"get": {"operationId": "get_dags", "summary": "Get all DAGs", "tags": ["DAGs"]}}}}
 
-    runtime_mock.assert_awaited_once()
-    await_args = runtime_mock.await_args
-    assert await_args is not None
-    kwargs = await_args.kwargs
-    assert kwargs["allowed_methods"] == {"GET"}
-    assert kwargs["static_tools"] is True
-    assert kwargs["resources_dir"] == "/tmp/resources"
 
+@pytest.fixture(scope="session")
+def mock_config():
+    """Create mock configuration."""
+    return AirflowConfig(base_url="http://localhost:8080", auth_token="test-token")
 
-@pytest.mark.asyncio
-async def test_unsafe_server_delegates_to_runtime(mock_config):
-    runtime_mock = AsyncMock()
-    with patch("airflow_mcp_server.server_unsafe._serve_airflow", runtime_mock):
-        await server_unsafe.serve(mock_config, static_tools=False, transport="streamable-http")
 
-    runtime_mock.assert_awaited_once()
-    await_args = runtime_mock.await_args
-    assert await_args is not None
-    kwargs = await_args.kwargs
-    assert kwargs["allowed_methods"] == {"GET", "POST", "PUT", "DELETE", "PATCH"}
-    assert kwargs["transport"] == "streamable-http"
+@pytest.fixture(scope="session")
+def mock_openapi_response():
+    """Mock OpenAPI response; shared across the session, so tests must not mutate it."""
+    return OPENAPI_SPEC
+
+
+@pytest.mark.parametrize(
+    ("server_module", "allowed_methods", "mode_label"),
+    [
+        pytest.param(server_safe, SAFE_METHODS, "Safe Mode", id="safe"),
+        pytest.param(server_unsafe, UNSAFE_METHODS, "Unsafe Mode", id="unsafe"),
+    ],
+)
+@pytest.mark.parametrize(
+    ("static_tools", "transport", "resources_dir", "transport_kwargs"),
+    [
+        pytest.param(True, "stdio", "/tmp/resources", {}, id="static-stdio"),
+        pytest.param(False, "streamable-http", None, {"host": "127.0.0.1", "port": 4000}, id="hierarchical-http"),
+    ],
+)
+async def test_server_delegates_to_runtime(mock_config, server_module, allowed_methods, mode_label, static_tools, transport, resources_dir, transport_kwargs):
+    calls: list[dict[str, Any]] = []
+
+    async def serve_airflow(**kwargs):
+        calls.append(kwargs)
+
+    with patch.object(server_module, "_serve_airflow", serve_airflow):
+        await server_module.serve(mock_config, static_tools=static_tools, transport=transport, resources_dir=resources_dir, **transport_kwargs)
+
+    assert calls == [
+        {
+            "config": mock_config,
+            "allowed_methods": allowed_methods,
+            "mode_label": mode_label,
+            "static_tools": static_tools,
+            "resources_dir": resources_dir,
+            "transport": transport,
+            "transport_kwargs": transport_kwargs,
+        }
+    ]
+
+
+@pytest.fixture(autouse=True)
+def openapi_cache_dir(monkeypatch, tmp_path):
+    """Keep the OpenAPI spec cache inside the test's temporary directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path / "airflow-mcp-server"
 
 
 class _FakeResponse:
-    def __init__(self, payload):
-        self._payload = payload
+    def __init__(self, payload, status: int = 200, headers: dict[str, str] | None = None):
+        self._body = orjson.dumps(payload)
+        self.status = status
+        self.headers = headers or {}
 
     async def __aenter__(self):
         return self
@@ -63,8 +99,11 @@ class _FakeResponse:
     def raise_for_status(self):
         return None
 
-    async def json(self):
-        return self._payload
+    def read(self):
+        # An already-resolved future is all the awaiting caller needs; no coroutine frame per read.
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(self._body)
+        return future
 
 
 class _FakeSession:
@@ -73,71 +112,65 @@ class _FakeSession:
         self.closed = False
         self.requests: list[tuple[str, dict[str, Any]]] = []
 
-    def get(self, path):
+    def get(self, path, headers=None):
+        self.requests.append((path, headers or {}))
         return self._response
 
     async def close(self):
         self.closed = True
 
 
-@pytest.mark.asyncio
-async def test_serve_airflow_static_tools(monkeypatch, mock_config, mock_openapi_response):
-    fake_response = _FakeResponse(mock_openapi_response)
-    fake_session = _FakeSession(fake_response)
-
-    monkeypatch.setattr("airflow_mcp_server.server_safe.aiohttp.ClientSession", lambda **_: fake_session)
+@pytest.fixture
+def fake_session(monkeypatch, mock_openapi_response):
+    """Serve the OpenAPI payload from a fake aiohttp session installed for _serve_airflow."""
+    session = _FakeSession(_FakeResponse(mock_openapi_response))
+    monkeypatch.setattr("airflow_mcp_server.server_safe.aiohttp.ClientSession", lambda **_: session)
+    return session
+
+
+async def test_serve_airflow_static_tools(fake_session, mock_config, mock_openapi_response):
+    with patch.multiple(
+        "airflow_mcp_server.server_safe",
+        AirflowOpenAPIToolset=DEFAULT,
+        _register_static_tools=DEFAULT,
+        HierarchicalToolManager=DEFAULT,
+        register_resources=DEFAULT,
+        _run_stdio=DEFAULT,
+    ) as mocks:
+        await server_safe._serve_airflow(
+            config=mock_config,
+            allowed_methods={"GET"},
+            mode_label="Safe Mode",
+            static_tools=True,
+            resources_dir=None,
+            transport="stdio",
+            transport_kwargs={},
+        )
 
-    toolset_instance = Mock()
-    with patch("airflow_mcp_server.server_safe.AirflowOpenAPIToolset", return_value=toolset_instance) as toolset_cls:
-        with patch("airflow_mcp_server.server_safe._register_static_tools") as register_static:
-            with patch("airflow_mcp_server.server_safe.HierarchicalToolManager") as manager_cls:
-                with patch("airflow_mcp_server.server_safe.register_resources") as register_resources:
-                    run_stdio = AsyncMock()
-                    with patch("airflow_mcp_server.server_safe._run_stdio", run_stdio):
-                        await server_safe._serve_airflow(
-                            config=mock_config,
-                            allowed_methods={"GET"},
-                            mode_label="Safe Mode",
-                            static_tools=True,
-                            resources_dir=None,
-                            transport="stdio",
-                            transport_kwargs={},
-                        )
-
-    toolset_cls.assert_called_once_with(mock_openapi_response, allow_mutations=False, session=fake_session)
-    register_static.assert_called_once()
-    manager_cls.assert_not_called()
-    register_resources.assert_called_once()
-    run_stdio.assert_awaited_once()
+    mocks["AirflowOpenAPIToolset"].assert_called_once_with(mock_openapi_response, allow_mutations=False, session=fake_session)
+    mocks["_register_static_tools"].assert_called_once()
+    mocks["HierarchicalToolManager"].assert_not_called()
+    mocks["register_resources"].assert_called_once_with(ANY, None)
+    mocks["_run_stdio"].assert_awaited_once()
     assert fake_session.closed is True
 
 
-@pytest.mark.asyncio
-async def test_serve_airflow_hierarchical_http(monkeypatch, mock_config, mock_openapi_response):
-    fake_response = _FakeResponse(mock_openapi_response)
-    fake_session = _FakeSession(fake_response)
-
-    monkeypatch.setattr("airflow_mcp_server.server_safe.aiohttp.ClientSession", lambda **_: fake_session)
-
-    toolset_instance = Mock()
-    with patch("airflow_mcp_server.server_safe.AirflowOpenAPIToolset", return_value=toolset_instance) as toolset_cls:
-        register_static = patch("airflow_mcp_server.server_safe._register_static_tools").start()
-        register_resources = patch("airflow_mcp_server.server_safe.register_resources").start()
-        manager_cls = patch("airflow_mcp_server.server_safe.HierarchicalToolManager").start()
-        run_http = AsyncMock()
-        patch("airflow_mcp_server.server_safe._run_streamable_http", run_http).start()
-        try:
-            await server_safe._serve_airflow(
-                config=mock_config,
-                allowed_methods={"GET", "POST"},
-                mode_label="Unsafe Mode",
-                static_tools=False,
-                resources_dir="/tmp/resources",
-                transport="streamable-http",
-                transport_kwargs={"host": "127.0.0.1", "port": 4000},
-            )
-        finally:
-            patch.stopall()
+async def test_serve_airflow_hierarchical_http(fake_session, mock_config, mock_openapi_response):
+    with ExitStack() as stack:
+        toolset_cls = stack.enter_context(patch("airflow_mcp_server.server_safe.AirflowOpenAPIToolset"))
+        register_static = stack.enter_context(patch("airflow_mcp_server.server_safe._register_static_tools"))
+        register_resources = stack.enter_context(patch("airflow_mcp_server.server_safe.register_resources"))
+        manager_cls = stack.enter_context(patch("airflow_mcp_server.server_safe.HierarchicalToolManager"))
+        run_http = stack.enter_context(patch("airflow_mcp_server.server_safe._run_streamable_http"))
+        await server_safe._serve_airflow(
+            config=mock_config,
+            allowed_methods={"GET", "POST"},
+            mode_label="Unsafe Mode",
+            static_tools=False,
+            resources_dir="/tmp/resources",
+            transport="streamable-http",
+            transport_kwargs={"host": "127.0.0.1", "port": 4000},
+        )
 
     toolset_cls.assert_called_once_with(mock_openapi_response, allow_mutations=True, session=fake_session)
     register_static.assert_not_called()
@@ -147,7 +180,42 @@ async def test_serve_airflow_hierarchical_http(monkeypatch, mock_config, mock_op
     assert fake_session.closed is True
 
 
-@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("transport", "transport_kwargs", "runner_name", "expected_args", "expected_kwargs"),
+    [
+        pytest.param("stdio", {}, "_run_stdio", (ANY, ANY), {}, id="stdio"),
+        pytest.param("streamable-http", {"port": 3000}, "_run_streamable_http", (ANY,), {"host": "localhost", "port": 3000}, id="streamable-http"),
+        pytest.param("sse", {"host": "0.0.0.0", "port": "3001"}, "_run_sse", (ANY, ANY), {"host": "0.0.0.0", "port": 3001}, id="sse"),
+    ],
+)
+async def test_serve_airflow_dispatches_transport(fake_session, mock_config, transport, transport_kwargs, runner_name, expected_args, expected_kwargs):
+    with patch.multiple(
+        "airflow_mcp_server.server_safe",
+        AirflowOpenAPIToolset=DEFAULT,
+        _register_static_tools=DEFAULT,
+        register_resources=DEFAULT,
+        _run_stdio=DEFAULT,
+        _run_streamable_http=DEFAULT,
+        _run_sse=DEFAULT,
+    ) as mocks:
+        await server_safe._serve_airflow(
+            config=mock_config,
+            allowed_methods={"GET"},
+            mode_label="Safe Mode",
+            static_tools=True,
+            resources_dir=None,
+            transport=transport,
+            transport_kwargs=transport_kwargs,
+        )
+
+    for name in ("_run_stdio", "_run_streamable_http", "_run_sse"):
+        if name == runner_name:
+            mocks[name].assert_awaited_once_with(*expected_args, **expected_kwargs)
+        else:
+            mocks[name].assert_not_awaited()
+    assert fake_session.closed is True
+
+
 async def test_serve_airflow_fetch_error(monkeypatch, mock_config):
     class FailingResponse:
         async def __aenter__(self):
@@ -157,7 +225,7 @@ async def test_serve_airflow_fetch_error(monkeypatch, mock_config):
             return False
 
     class FailingSession(_FakeSession):
-        def get(self, path):
+        def get(self, path, headers=None):
             return FailingResponse()
 
     fake_session = FailingSession(None)
@@ -177,30 +245,67 @@ async def test_serve_airflow_fetch_error(monkeypatch, mock_config):
     assert fake_session.closed is True
 
 
-@pytest.mark.asyncio
-async def test_serve_airflow_requires_valid_config():
-    config_no_url = AirflowConfig.__new__(AirflowConfig)
-    config_no_url.base_url = None
-    config_no_url.auth_token = "token"
-
-    with pytest.raises(ValueError, match="base_url is required"):
-        await server_safe._serve_airflow(
-            config=config_no_url,
-            allowed_methods={"GET"},
-            mode_label="Safe Mode",
-            static_tools=True,
-            resources_dir=None,
-            transport="stdio",
-            transport_kwargs={},
-        )
-
-    config_no_token = AirflowConfig.__new__(AirflowConfig)
-    config_no_token.base_url = "http://localhost"
-    config_no_token.auth_token = None
-
-    with pytest.raises(ValueError, match="auth_token is required"):
+async def test_fetch_openapi_spec_revalidates_cached_copy(mock_openapi_response, openapi_cache_dir):
+    fresh = _FakeSession(_FakeResponse(mock_openapi_response, headers={"ETag": '"v1"'}))
+    assert await server_safe._fetch_openapi_spec(fresh, "http://localhost:8080") == mock_openapi_response
+    assert fresh.requests == [("/openapi.json", {})]
+    assert [path.name for path in openapi_cache_dir.iterdir()] == ["openapi-localhost_8080.json"]
+    assert (openapi_cache_dir / "openapi-localhost_8080.json").read_bytes().startswith(b'"v1"\n')
+
+    changed = _FakeSession(_FakeResponse(mock_openapi_response, headers={"ETag": '"v2"'}))
+    with patch("airflow_mcp_server.server_safe._read_cached_spec") as read_cached_spec:
+        assert await server_safe._fetch_openapi_spec(changed, "http://localhost:8080") == mock_openapi_response
+    read_cached_spec.assert_not_called()
+    assert changed.requests == [("/openapi.json", {"If-None-Match": '"v1"'})]
+
+    not_modified = _FakeSession(_FakeResponse(None, status=304))
+    assert await server_safe._fetch_openapi_spec(not_modified, "http://localhost:8080") == mock_openapi_response
+    assert not_modified.requests == [("/openapi.json", {"If-None-Match": '"v2"'})]
+
+
+@pytest.mark.parametrize(
+    ("cache_contents", "expected_headers"),
+    [
+        pytest.param(None, {}, id="missing-cache"),
+        pytest.param(b"not json", {}, id="no-etag-line"),
+        pytest.param(b'"v1"\nnot json', {"If-None-Match": '"v1"'}, id="unreadable-spec"),
+    ],
+)
+async def test_fetch_openapi_spec_not_modified_without_cache(openapi_cache_dir, cache_contents, expected_headers):
+    if cache_contents is not None:
+        openapi_cache_dir.mkdir(parents=True)
+        (openapi_cache_dir / "openapi-localhost_8080.json").write_bytes(cache_contents)
+    session = _FakeSession(_FakeResponse(None, status=304))
+
+    with pytest.raises(ValueError, match="304 Not Modified"):
+        await server_safe._fetch_openapi_spec(session, "http://localhost:8080")
+    assert session.requests == [("/openapi.json", expected_headers)]
+
+
+async def test_fetch_openapi_spec_without_home_directory(monkeypatch, mock_openapi_response):
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+
+    def _no_home():
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.setattr(server_safe.Path, "home", _no_home)
+    session = _FakeSession(_FakeResponse(mock_openapi_response, headers={"ETag": '"v1"'}))
+
+    assert await server_safe._fetch_openapi_spec(session, "http://localhost:8080") == mock_openapi_response
+    assert session.requests == [("/openapi.json", {})]
+
+
+@pytest.mark.parametrize(
+    ("config", "error"),
+    [
+        pytest.param(CONFIG_NO_URL, "base_url is required", id="missing-base-url"),
+        pytest.param(CONFIG_NO_TOKEN, "auth_token is required", id="missing-auth-token"),
+    ],
+)
+async def test_serve_airflow_requires_valid_config(config, error):
+    with pytest.raises(ValueError, match=error):
         await server_safe._serve_airflow(
-            config=config_no_token,
+            config=config,
             allowed_methods={"GET"},
             mode_label="Safe Mode",
             static_tools=True,